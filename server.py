@@ -1,9 +1,10 @@
+import json
 import os
 import random
-import uvicorn
+import re
 from starlette.applications import Starlette
 from starlette.routing import Mount, Route
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from mcp.server.fastmcp import FastMCP
 
 # Initialize
@@ -12,32 +13,42 @@ mcp = FastMCP(SERVER_NAME)
 
 # --- The Content ---
 
-RAJINI_JOKES = [
+RAJINI_JOKES = (
     "Rajinikanth can delete the Recycle Bin.",
     "Rajinikanth knows the last digit of Pi.",
     "When Rajinikanth does a pushup, he isn't lifting himself up, he's pushing the Earth down.",
     "Rajinikanth once kicked a horse in the chin. Its descendants are now known as Giraffes.",
     "Rajinikanth can strangle you with a cordless phone.",
     "Google searches for Rajinikanth because it knows he can find anything.",
-]
+)
 
-KAMAL_QUOTES = [
+KAMAL_QUOTES = (
     "I am a hero who wants to be a villain. — Kamal Haasan",
     "Art is a lie that makes us realize the truth. — Kamal Haasan",
     "I don't believe in boundaries. I am an artist, the world is my stage. — Kamal Haasan",
     "Failure is the only way to learn. Success is just the ego boost. — Kamal Haasan",
     "Mediocrity is a sin in my book. — Kamal Haasan",
     "Sympathy is a reaction. Empathy is an action. — Kamal Haasan",
-]
+)
+
+# Bound method of the module-level Random, which the stdlib reseeds in forked workers
+_choice = random.choice
+
+# Case-insensitive substring checks without allocating a lowered copy of the input
+_RAJINI_SEARCH = re.compile("rajini", re.I).search
+_KAMAL_SEARCH = re.compile("kamal", re.I).search
+
+# Full replies are built once so a request only has to pick one
+_RAJINI_REPLIES = tuple("😎 THALAIVAR SAYS: " + j for j in RAJINI_JOKES)
+_KAMAL_REPLIES = tuple("🎭 ULAGANAYAGAN SAYS: " + q for q in KAMAL_QUOTES)
 
 # --- The Logic (Regular Function) ---
 
 def get_entertainment_logic(category: str) -> str:
-    cat = category.lower().strip()
-    if "rajini" in cat:
-        return f"😎 THALAIVAR SAYS: {random.choice(RAJINI_JOKES)}"
-    elif "kamal" in cat:
-        return f"🎭 ULAGANAYAGAN SAYS: {random.choice(KAMAL_QUOTES)}"
+    if _RAJINI_SEARCH(category):
+        return _choice(_RAJINI_REPLIES)
+    elif _KAMAL_SEARCH(category):
+        return _choice(_KAMAL_REPLIES)
     else:
         return "Please choose either 'rajini' or 'kamal'."
 
@@ -64,26 +75,54 @@ TOOL_DEFINITIONS = [
     }
 ]
 
+# Serialized once at import; only the request id changes between tools/list replies.
+_TOOLS_JSON = json.dumps(TOOL_DEFINITIONS, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+_HEALTH_BODY = b'{"status":"online","protocol":"sse"}'
+
+# The canonical tools/list request, matched against the whole body so nested
+# keys or trailing garbage never qualify; anything else goes through json.loads.
+_WS = rb'[ \t\n\r]*'
+_TOOLS_LIST_RE = re.compile(
+    _WS + rb'\{' + _WS + rb'"jsonrpc"' + _WS + rb':' + _WS + rb'"2\.0"' + _WS + rb','
+    + _WS + rb'"id"' + _WS + rb':' + _WS + rb'(-?(?:0|[1-9][0-9]*))' + _WS + rb','
+    + _WS + rb'"method"' + _WS + rb':' + _WS + rb'"tools/list"' + _WS
+    + rb'(?:,' + _WS + rb'"params"' + _WS + rb':' + _WS + rb'\{' + _WS + rb'\}' + _WS + rb')?'
+    + rb'\}' + _WS
+)
+
+def _tools_list_response(rid: bytes) -> Response:
+    payload = b'{"jsonrpc":"2.0","id":' + rid + b',"result":{"tools":' + _TOOLS_JSON + b'}}'
+    return Response(payload, media_type="application/json")
+
 async def handle_drsti_connection(request):
     """
     Handles Drsti.ai's requests manually to prevent connection errors.
     """
+    # 0. Empty probes carry no body, so skip reading/parsing it entirely
+    cl = request.headers.get("content-length")
+    if cl == "0" or (cl is None and "transfer-encoding" not in request.headers):
+        return Response(_HEALTH_BODY, media_type="application/json")
+
+    raw = await request.body()
+
+    # 1. Fast path: canonical tools/list with an integer id
+    m = _TOOLS_LIST_RE.fullmatch(raw)
+    if m:
+        return _tools_list_response(m.group(1))
+
     try:
-        body = await request.json()
+        body = json.loads(raw)
     except:
         body = {}
 
     method = body.get("method")
 
-    # 1. If Drsti asks for the list of tools
+    # 2. If Drsti asks for the list of tools
     if method == "tools/list":
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "id": body.get("id", 1),
-            "result": { "tools": TOOL_DEFINITIONS }
-        })
+        rid = json.dumps(body.get("id", 1), ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+        return _tools_list_response(rid.encode("utf-8"))
 
-    # 2. If Drsti tries to RUN the tool (The Critical Fix)
+    # 3. If Drsti tries to RUN the tool (The Critical Fix)
     if method == "tools/call":
         params = body.get("params", {}).get("arguments", {})
         tool_name = body.get("params", {}).get("name")
@@ -101,8 +140,8 @@ async def handle_drsti_connection(request):
                 }
             })
 
-    # 3. Default Health Check (Only return this if nothing else matches)
-    return JSONResponse({"status": "online", "protocol": "sse"})
+    # 4. Default Health Check (Only return this if nothing else matches)
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 # --- Run Server ---
 
@@ -117,5 +156,7 @@ routes = [
 app = Starlette(routes=routes)
 
 if __name__ == "__main__":
+    import uvicorn
+
     port = int(os.environ.get("PORT", 8000))
     uvicorn.run(app, host="0.0.0.0", port=port)